@@ -12,12 +12,90 @@ from rez.vendor import yaml
 from rez.vendor.yaml.error import YAMLError
 from rez.utils.yaml import dump_yaml
 from collections import defaultdict
+import copy
 import os
 import os.path
 import shutil
 import sys
 
 
+# parsed suite.yaml data, as {filepath: ((mtime_ns, size), data)}. Only the
+# latest version of each file is kept.
+_suite_data_cache = {}
+
+
+class _ToolEntry(object):
+    """A tool exposed by a suite.
+
+    Fields are read as attributes. The read-only parts of the dict interface
+    (item access, `in`, `get`, `keys`, `items` etc) are also supported, for
+    compatibility with code written against the dicts that `Suite` used to
+    return. Entries themselves can't be changed - `copy` returns a plain dict.
+    """
+    __slots__ = ("tool_name", "tool_alias", "context_name", "variant")
+
+    def __init__(self, tool_name, tool_alias, context_name, variant):
+        self.tool_name = tool_name
+        self.tool_alias = tool_alias
+        self.context_name = context_name
+        self.variant = variant
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def get(self, key, default=None):
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key)
+
+    def keys(self):
+        return list(self.__slots__)
+
+    def values(self):
+        return list(self._fields())
+
+    def items(self):
+        return list(zip(self.__slots__, self._fields()))
+
+    def copy(self):
+        return dict(self.items())
+
+    def _fields(self):
+        return (self.tool_name, self.tool_alias, self.context_name,
+                self.variant)
+
+    def __eq__(self, other):
+        if isinstance(other, _ToolEntry):
+            return self._fields() == other._fields()
+        if isinstance(other, dict):
+            return self.copy() == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__,
+                           ", ".join("%s=%r" % (k, getattr(self, k))
+                                     for k in self.__slots__))
+
+
 class Suite(object):
     """A collection of contexts.
 
@@ -49,15 +127,21 @@ class Suite(object):
         self.tools = None
         self.tool_conflicts = None
         self.hidden_tools = None
+        self._context_tools = None
+        self._context_hidden_tools = None
+        self._alias_contexts = None
+        self._tools_shared = False
+        # context data, in ascending priority order
+        self._ordered_contexts = []
 
     @property
     def context_names(self):
         """Get the names of the contexts in the suite.
 
-        Reurns:
+        Returns:
             List of strings.
         """
-        return list(self.contexts.keys())
+        return list(self.contexts)
 
     @cached_property
     def tools_path(self):
@@ -82,7 +166,7 @@ class Suite(object):
         return executor.get_output().strip()
 
     def __str__(self):
-        return "%s(%s)" % (self.__class__.__name__, " ".join(self.context_names))
+        return "%s(%s)" % (self.__class__.__name__, " ".join(self.contexts))
 
     def context(self, name):
         """Get a context.
@@ -94,16 +178,7 @@ class Suite(object):
             `ResolvedContext` object.
         """
         data = self._context(name)
-        context = data.get("context")
-        if context:
-            return context
-
-        assert self.load_path
-        context_path = os.path.join(self.load_path, "contexts", "%s.rxt" % name)
-        context = ResolvedContext.load(context_path)
-        data["context"] = context
-        data["loaded"] = True
-        return context
+        return self._load_context(data)
 
     def add_context(self, name, context, prefix_char=None):
         """Add a context to the suite.
@@ -117,13 +192,18 @@ class Suite(object):
         if not context.success:
             raise SuiteError("Context is not resolved: %r" % name)
 
-        self.contexts[name] = dict(name=name,
-                                   context=context.copy(),
-                                   tool_aliases={},
-                                   hidden_tools=set(),
-                                   priority=self._next_priority,
-                                   prefix_char=prefix_char)
-        self._flush_tools()
+        # every tool entry refers to its context by name
+        name = sys.intern(name)
+        data = dict(name=name,
+                    context=context.copy(),
+                    tool_aliases={},
+                    hidden_tools=set(),
+                    priority=self._next_priority,
+                    prefix_char=prefix_char)
+
+        self.contexts[name] = data
+        self._ordered_contexts.append(data)
+        self._flush_context_tools(name)
 
     def find_contexts(self, in_request=None, in_resolve=None):
         """Find contexts in the suite based on search criteria.
@@ -173,9 +253,10 @@ class Suite(object):
         Args:
             name (str): Name of the context to remove.
         """
-        self._context(name)
+        data = self._context(name)
         del self.contexts[name]
-        self._flush_tools()
+        self._unorder_context(data)
+        self._flush_context_tools(name)
 
     def set_context_prefix(self, name, prefix):
         """Set a context's prefix.
@@ -190,7 +271,7 @@ class Suite(object):
         """
         data = self._context(name)
         data["prefix"] = prefix
-        self._flush_tools()
+        self._flush_context_tools(name)
 
     def remove_context_prefix(self, name):
         """Remove a context's prefix.
@@ -213,7 +294,7 @@ class Suite(object):
         """
         data = self._context(name)
         data["suffix"] = suffix
-        self._flush_tools()
+        self._flush_context_tools(name)
 
     def remove_context_suffix(self, name):
         """Remove a context's suffix.
@@ -227,7 +308,12 @@ class Suite(object):
         """Causes the context's tools to take priority over all others."""
         data = self._context(name)
         data["priority"] = self._next_priority
-        self._flush_tools()
+
+        # new priority is the highest, so the context moves to the end
+        self._unorder_context(data)
+        self._ordered_contexts.append(data)
+
+        self._resolve_context_aliases(name)
 
     def hide_tool(self, context_name, tool_name):
         """Hide a tool so that it is not exposed in the suite.
@@ -239,9 +325,9 @@ class Suite(object):
         data = self._context(context_name)
         hidden_tools = data["hidden_tools"]
         if tool_name not in hidden_tools:
-            self._validate_tool(context_name, tool_name)
+            self._validate_tool(data, tool_name)
             hidden_tools.add(tool_name)
-            self._flush_tools()
+            self._flush_context_tools(context_name)
 
     def unhide_tool(self, context_name, tool_name):
         """Unhide a tool so that it may be exposed in a suite.
@@ -257,7 +343,7 @@ class Suite(object):
         hidden_tools = data["hidden_tools"]
         if tool_name in hidden_tools:
             hidden_tools.remove(tool_name)
-            self._flush_tools()
+            self._flush_context_tools(context_name)
 
     def alias_tool(self, context_name, tool_name, tool_alias):
         """Register an alias for a specific tool.
@@ -274,9 +360,9 @@ class Suite(object):
         if tool_name in aliases:
             raise SuiteError("Tool %r in context %r is already aliased to %r"
                              % (tool_name, context_name, aliases[tool_name]))
-        self._validate_tool(context_name, tool_name)
+        self._validate_tool(data, tool_name)
         aliases[tool_name] = tool_alias
-        self._flush_tools()
+        self._flush_context_tools(context_name)
 
     def unalias_tool(self, context_name, tool_name):
         """Deregister an alias for a specific tool.
@@ -289,13 +375,14 @@ class Suite(object):
         aliases = data["tool_aliases"]
         if tool_name in aliases:
             del aliases[tool_name]
-            self._flush_tools()
+            self._flush_context_tools(context_name)
 
     def get_tools(self):
         """Get the tools exposed by this suite.
 
         Returns:
-            dict: A dict, keyed by aliased tool name, with dict entries:
+            dict: A dict, keyed by aliased tool name, with entries having
+            the attributes:
 
             - tool_name (str): The original, non-aliased name of the tool;
             - tool_alias (str): Aliased tool name (same as key);
@@ -303,8 +390,12 @@ class Suite(object):
             - variant (`Variant` or set): Variant providing the tool. If the
               tool is in conflict within the context (more than one package has
               a tool of the same name), this will be a set of Variants.
+
+            Entries also support read-only dict access (eg
+            `entry["tool_name"]`); use `entry.copy()` to get a mutable dict.
         """
         self._update_tools()
+        self._tools_shared = True
         return self.tools
 
     def get_tool_filepath(self, tool_alias):
@@ -339,9 +430,9 @@ class Suite(object):
             tool alias, or None if the alias is not available.
         """
         tools_dict = self.get_tools()
-        data = tools_dict.get(tool_alias)
-        if data:
-            return data["context_name"]
+        entry = tools_dict.get(tool_alias)
+        if entry:
+            return entry.context_name
         return None
 
     def get_hidden_tools(self):
@@ -350,7 +441,7 @@ class Suite(object):
         Hidden tools are those that have been explicitly hidden via `hide_tool`.
 
         Returns:
-            list[dict]: A list of dicts, where each dict contains:
+            list: A list of entries, each having the attributes:
 
             - tool_name (str): The original, non-aliased name of the tool;
             - tool_alias (str): Aliased tool name (same as key);
@@ -375,8 +466,8 @@ class Suite(object):
         Args:
             tool_alias (str): Alias to check for conflicts.
 
-        Returns: None if the alias has no conflicts, or a list of dicts, where
-            each dict contains:
+        Returns: None if the alias has no conflicts, or a list of entries,
+            each having the attributes:
             - tool_name (str): The original, non-aliased name of the tool;
             - tool_alias (str): Aliased tool name (same as key);
             - context_name (str): Name of the context containing the tool;
@@ -387,8 +478,8 @@ class Suite(object):
 
     def validate(self):
         """Validate the suite."""
-        for context_name in self.context_names:
-            context = self.context(context_name)
+        for context_name, data in self.contexts.items():
+            context = self._load_context(data)
             try:
                 context.validate()
             except ResolvedContextError as e:
@@ -396,24 +487,24 @@ class Suite(object):
                                  % (context_name, str(e)))
 
     def to_dict(self):
+        # keys only relevant at runtime, which aren't serialized
+        runtime_keys = ("context", "loaded")
+
         contexts_ = {}
         for k, data in self.contexts.items():
-            data_ = data.copy()
-            if "context" in data_:
-                del data_["context"]
-            if "loaded" in data_:
-                del data_["loaded"]
-            contexts_[k] = data_
+            contexts_[k] = {
+                key: value for key, value in data.items()
+                if key not in runtime_keys
+            }
 
         return dict(contexts=contexts_)
 
     @classmethod
     def from_dict(cls, d):
-        s = Suite.__new__(Suite)
-        s.load_path = None
-        s.tools = None
-        s.tool_conflicts = None
+        s = cls()
         s.contexts = d["contexts"]
+        s._ordered_contexts = sorted(s.contexts.values(),
+                                     key=lambda x: x["priority"])
         if s.contexts:
             s.next_priority = max(x["priority"]
                                   for x in s.contexts.values()) + 1
@@ -430,18 +521,31 @@ class Suite(object):
                 exists, an error is raised.
         """
         path = os.path.realpath(path)
+        contexts_path = os.path.join(path, "contexts")
+        tools_path = os.path.join(path, "bin")
+        overwrite = False
+
         if os.path.exists(path):
             if self.load_path and self.load_path == path:
                 if verbose:
                     print("saving over previous suite...")
-                for context_name in self.context_names:
-                    self.context(context_name)  # load before dir deleted
-                shutil.rmtree(path)
+                overwrite = True
             else:
                 raise SuiteError("Cannot save, path exists: %r" % path)
 
-        contexts_path = os.path.join(path, "contexts")
-        os.makedirs(contexts_path)
+        if overwrite:
+            # contexts that were never loaded are unchanged on disk, so rather
+            # than deleting the suite, just remove files that are now stale
+            os.makedirs(contexts_path, exist_ok=True)
+            for filename in os.listdir(contexts_path):
+                name, ext = os.path.splitext(filename)
+                if ext == ".rxt" and name not in self.contexts:
+                    os.remove(os.path.join(contexts_path, filename))
+
+            if os.path.exists(tools_path):
+                shutil.rmtree(tools_path)
+        else:
+            os.makedirs(contexts_path)
 
         # write suite data
         data = self.to_dict()
@@ -449,9 +553,15 @@ class Suite(object):
         with open(filepath, "w") as f:
             f.write(dump_yaml(data))
 
+        # the file's stat may not change on filesystems with coarse mtimes
+        _suite_data_cache.pop(filepath, None)
+
         # write contexts
-        for context_name in self.context_names:
-            context = self.context(context_name)
+        for context_name, data in self.contexts.items():
+            if overwrite and data.get("context") is None:
+                continue  # still on disk, and unchanged
+
+            context = self._load_context(data)
             context._set_parent_suite(path, context_name)
             filepath = self._context_path(context_name, path)
             if verbose:
@@ -459,15 +569,14 @@ class Suite(object):
             context.save(filepath)
 
         # create alias wrappers
-        tools_path = os.path.join(path, "bin")
         os.makedirs(tools_path)
         if verbose:
             print("creating alias wrappers in %r..." % tools_path)
 
         tools = self.get_tools()
-        for tool_alias, d in tools.items():
-            tool_name = d["tool_name"]
-            context_name = d["context_name"]
+        for tool_alias, entry in tools.items():
+            tool_name = entry.tool_name
+            context_name = entry.context_name
 
             data = self._context(context_name)
             prefix_char = data.get("prefix_char")
@@ -492,14 +601,29 @@ class Suite(object):
         if not os.path.isfile(filepath):
             raise SuiteError("Not a suite: %r" % path)
 
-        try:
-            with open(filepath) as f:
-                data = yaml.load(f.read(), Loader=yaml.FullLoader)
-        except YAMLError as e:
-            raise SuiteError("Failed loading suite: %s" % str(e))
+        load_path = os.path.realpath(path)
+        cache_key = os.path.join(load_path, "suite.yaml")  # as used by save()
+        st = os.stat(filepath)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        data = None
+
+        cached = _suite_data_cache.get(cache_key)
+        if cached and cached[0] == stat_key:
+            data = cached[1]
 
-        s = cls.from_dict(data)
-        s.load_path = os.path.realpath(path)
+        if data is None:
+            try:
+                # the yaml reader pulls small chunks and decodes them itself,
+                # so hand it a well buffered binary stream
+                with open(filepath, "rb", buffering=65536) as f:
+                    data = yaml.load(f, Loader=yaml.SafeLoader)
+            except YAMLError as e:
+                raise SuiteError("Failed loading suite: %s" % str(e))
+            _suite_data_cache[cache_key] = (stat_key, data)
+
+        # copy, so that changes to the loaded suite don't affect the cache
+        s = cls.from_dict(copy.deepcopy(data))
+        s.load_path = load_path
         return s
 
     @classmethod
@@ -550,9 +674,9 @@ class Suite(object):
         context_tools = defaultdict(set)
         context_variants = defaultdict(set)
         for entry in tools:
-            context_name = entry["context_name"]
-            context_tools[context_name].add(entry["tool_name"])
-            context_variants[context_name].add(str(entry["variant"]))
+            context_name = entry.context_name
+            context_tools[context_name].add(entry.tool_name)
+            context_variants[context_name].add(str(entry.variant))
 
         _pr()
         rows = [["NAME", "VISIBLE TOOLS", "PATH"],
@@ -578,13 +702,13 @@ class Suite(object):
                 context.
         """
         def _get_row(entry):
-            context_name_ = entry["context_name"]
-            tool_alias = entry["tool_alias"]
-            tool_name = entry["tool_name"]
+            context_name_ = entry.context_name
+            tool_alias = entry.tool_alias
+            tool_name = entry.tool_name
             properties = []
             col = None
 
-            variant = entry["variant"]
+            variant = entry.variant
             if isinstance(variant, set):
                 properties.append("(in conflict)")
                 col = critical
@@ -616,53 +740,47 @@ class Suite(object):
 
         rows = [["TOOL", "ALIASING", "PACKAGE", "CONTEXT", ""],
                 ["----", "--------", "-------", "-------", ""]]
-        colors = [None, None]
+        colors = {}  # row index -> style, for styled rows only
 
+        # (entry, label) tuples, keyed by context name
         entries_dict = defaultdict(list)
-        for d in self.get_tools().values():
-            entries_dict[d["context_name"]].append(d)
+        for entry in self.get_tools().values():
+            entries_dict[entry.context_name].append((entry, None))
 
         if verbose:
             # add hidden entries
-            for d in self.hidden_tools:
-                d_ = d.copy()
-                d_["hidden"] = True
-                entries_dict[d["context_name"]].append(d_)
+            for entry in self.hidden_tools:
+                entries_dict[entry.context_name].append((entry, "(hidden)"))
 
             # add conflicting tools
-            for docs in self.tool_conflicts.values():
-                for d in docs:
-                    d_ = d.copy()
-                    d_["conflicting"] = True
-                    entries_dict[d["context_name"]].append(d_)
+            for entries in self.tool_conflicts.values():
+                for entry in entries:
+                    entries_dict[entry.context_name].append(
+                        (entry, "(not visible)"))
 
         for i, context_name in enumerate(context_names):
             entries = entries_dict.get(context_name, [])
             if entries:
                 if i:
                     rows.append(('', '', '', '', ''))
-                    colors.append(None)
 
-                entries = sorted(entries, key=lambda x: x["tool_alias"].lower())
-                for entry in entries:
+                entries = sorted(entries, key=lambda x: x[0].tool_alias.lower())
+                for entry, label in entries:
                     row, col = _get_row(entry)
-                    if "hidden" in entry:
-                        row[-1] = "(hidden)"
-                        rows.append(row)
-                        colors.append(warning)
-                    elif "conflicting" in entry:
-                        row[-1] = "(not visible)"
-                        rows.append(row)
-                        colors.append(warning)
-                    else:
-                        rows.append(row)
-                        colors.append(col)
+                    if label:
+                        row[-1] = label
+                        col = warning
+                    if col:
+                        colors[len(rows)] = col
+                    rows.append(row)
 
         _pr = Printer(buf)
 
         if rows:
-            for col, line in zip(colors, columnise(rows)):
-                _pr(line, col)
+            # style lines individually, but print (and flush) just once
+            lines = [_pr.get(line, colors.get(i))
+                     for i, line in enumerate(columnise(rows))]
+            _pr("\n".join(lines))
         else:
             _pr("No tools available.")
 
@@ -672,6 +790,18 @@ class Suite(object):
             raise SuiteError("No such context: %r" % name)
         return data
 
+    def _load_context(self, data):
+        context = data.get("context")
+        if context:
+            return context
+
+        assert self.load_path
+        context_path = self._context_path(data["name"])
+        context = ResolvedContext.load(context_path)
+        data["context"] = context
+        data["loaded"] = True
+        return context
+
     def _context_path(self, name, suite_path=None):
         suite_path = suite_path or self.load_path
         if not suite_path:
@@ -680,7 +810,14 @@ class Suite(object):
         return filepath
 
     def _sorted_contexts(self):
-        return sorted(self.contexts.values(), key=lambda x: x["priority"])
+        return self._ordered_contexts
+
+    def _unorder_context(self, data):
+        # by identity, comparing context dicts by value is needlessly slow
+        for i, data_ in enumerate(self._ordered_contexts):
+            if data_ is data:
+                del self._ordered_contexts[i]
+                return
 
     @property
     def _next_priority(self):
@@ -688,67 +825,172 @@ class Suite(object):
         self.next_priority += 1
         return p
 
-    def _flush_tools(self):
-        self.tools = None
-        self.tool_conflicts = None
-        self.hidden_tools = None
-
-    def _validate_tool(self, context_name, tool_name):
-        context = self.context(context_name)
+    def _validate_tool(self, data, tool_name):
+        context = self._load_context(data)
         context_tools = context.get_tools(request_only=True)
         for _, tool_names in context_tools.values():
             if tool_name in tool_names:
                 return
         raise SuiteError("No such tool %r in context %r"
-                         % (tool_name, context_name))
+                         % (tool_name, data["name"]))
 
     def _update_tools(self):
         if self.tools is not None:
             return
         self.tools = {}
         self.hidden_tools = []
-        self.tool_conflicts = defaultdict(list)
+        self.tool_conflicts = {}
+        self._tools_shared = False
+        self._context_tools = {}
+        self._context_hidden_tools = {}
+        self._alias_contexts = defaultdict(set)
 
-        for data in reversed(self._sorted_contexts()):
-            context_name = data["name"]
-            tool_aliases = data["tool_aliases"]
-            hidden_tools = data["hidden_tools"]
-            prefix = data.get("prefix", "")
-            suffix = data.get("suffix", "")
-
-            context = self.context(context_name)
-            context_tools = context.get_tools(request_only=True)
-
-            for variant, tool_names in context_tools.values():
-                for tool_name in tool_names:
-                    alias = tool_aliases.get(tool_name)
-                    if alias is None:
-                        alias = "%s%s%s" % (prefix, tool_name, suffix)
-
-                    entry = dict(tool_name=tool_name,
-                                 tool_alias=alias,
-                                 context_name=context_name,
-                                 variant=variant)
-
-                    if tool_name in hidden_tools:
-                        self.hidden_tools.append(entry)
-                        continue
-
-                    existing_entry = self.tools.get(alias)
-                    if existing_entry:
-                        if existing_entry.get("context_name") == context_name:
-                            # the same tool is provided in the same context by
-                            # more than one package.
-                            existing_variant = existing_entry["variant"]
-                            if isinstance(existing_variant, set):
-                                existing_variant.add(variant)
-                            else:
-                                existing_entry["variant"] = set([existing_variant,
-                                                                 variant])
-                        else:
-                            self.tool_conflicts[alias].append(entry)
+        for data in self.contexts.values():
+            self._add_context_tools(data)
+
+        for alias in list(self._alias_contexts.keys()):
+            self._resolve_alias(alias)
+        self._update_hidden_tools()
+
+    def _flush_context_tools(self, context_name):
+        """Update tools after a change to (or removal of) a context.
+
+        Only the aliases that the context provides, before or after the change,
+        are re-resolved. Nothing is done if tools have not been built yet.
+        """
+        if self.tools is None:
+            return
+
+        self._unshare_tools()
+        aliases = self._remove_context_tools(context_name)
+        data = self.contexts.get(context_name)
+        if data is not None:
+            aliases.update(self._add_context_tools(data))
+
+        for alias in aliases:
+            self._resolve_alias(alias)
+        self._update_hidden_tools()
+
+    def _resolve_context_aliases(self, context_name):
+        """Update tools after a change to a context's priority.
+
+        The context's tool entries are unaffected by priority, so they are
+        reused as is - only the aliases they provide are re-resolved.
+        """
+        if self.tools is None:
+            return
+
+        self._unshare_tools()
+        for alias in self._context_tools[context_name].keys():
+            self._resolve_alias(alias)
+        self._update_hidden_tools()
+
+    def _unshare_tools(self):
+        """Copy the tool dicts if they have been handed out by `get_tools`.
+
+        Callers may hold on to (or be iterating over) the returned dicts, so
+        they're never updated in place once shared.
+        """
+        if self._tools_shared:
+            self.tools = dict(self.tools)
+            self.tool_conflicts = dict(self.tool_conflicts)
+            self._tools_shared = False
+
+    def _add_context_tools(self, data):
+        """Tabulate a context's tools, and return the aliases it provides."""
+        context_name = sys.intern(data["name"])
+        tool_aliases = data["tool_aliases"]
+        hidden_tools = data["hidden_tools"]
+        prefix = data.get("prefix", "")
+        suffix = data.get("suffix", "")
+
+        context = self._load_context(data)
+        context_tools = context.get_tools(request_only=True)
+        alias_entries = defaultdict(list)
+        hidden_entries = []
+        affixed = bool(prefix or suffix)
+
+        # local bindings, this loop runs once per tool in the context
+        get_alias = tool_aliases.get
+        add_hidden = hidden_entries.append
+
+        for variant, tool_names in context_tools.values():
+            for tool_name in tool_names:
+                alias = get_alias(tool_name)
+                if alias is None:
+                    if affixed:
+                        alias = prefix + tool_name + suffix
                     else:
-                        self.tools[alias] = entry
+                        alias = tool_name
+
+                entry = _ToolEntry(tool_name=tool_name,
+                                   tool_alias=alias,
+                                   context_name=context_name,
+                                   variant=variant)
+
+                if tool_name in hidden_tools:
+                    add_hidden(entry)
+                else:
+                    alias_entries[alias].append(entry)
+
+        self._context_tools[context_name] = alias_entries
+        self._context_hidden_tools[context_name] = hidden_entries
+
+        alias_contexts = self._alias_contexts
+        for alias in alias_entries.keys():
+            alias_contexts[alias].add(context_name)
+        return set(alias_entries.keys())
+
+    def _remove_context_tools(self, context_name):
+        """Remove a context's tools, and return the aliases it provided."""
+        alias_entries = self._context_tools.pop(context_name, {})
+        self._context_hidden_tools.pop(context_name, None)
+
+        alias_contexts = self._alias_contexts
+        for alias in alias_entries.keys():
+            alias_contexts[alias].discard(context_name)
+        return set(alias_entries.keys())
+
+    def _resolve_alias(self, alias):
+        """Determine which context's tool is exposed as the given alias.
+
+        The highest priority context providing the alias wins. Instances of the
+        alias in other contexts are recorded as conflicts.
+        """
+        self.tools.pop(alias, None)
+        self.tool_conflicts.pop(alias, None)
+
+        context_names = self._alias_contexts.get(alias)
+        if not context_names:
+            self._alias_contexts.pop(alias, None)
+            return
+
+        context_names = sorted(context_names,
+                               key=lambda x: self.contexts[x]["priority"],
+                               reverse=True)
+
+        entries = self._context_tools[context_names[0]][alias]
+        entry = entries[0]
+        if len(entries) > 1:
+            # the same tool is provided in the same context by more than one
+            # package.
+            entry = _ToolEntry(tool_name=entry.tool_name,
+                               tool_alias=alias,
+                               context_name=entry.context_name,
+                               variant=set(x.variant for x in entries))
+        self.tools[alias] = entry
+
+        if len(context_names) > 1:
+            self.tool_conflicts[alias] = [
+                x for context_name in context_names[1:]
+                for x in self._context_tools[context_name][alias]
+            ]
+
+    def _update_hidden_tools(self):
+        self.hidden_tools = []
+        for data in reversed(self._sorted_contexts()):
+            entries = self._context_hidden_tools[data["name"]]
+            self.hidden_tools.extend(entries)
 
 
 def _FWD__invoke_suite_tool_alias(context_name, tool_name, prefix_char=None,
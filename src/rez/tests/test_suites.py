@@ -12,6 +12,7 @@ from rez.suite import Suite
 from rez.config import config
 from rez.system import system
 import subprocess
+import shutil
 import unittest
 import uuid
 import os.path
@@ -40,6 +41,12 @@ class TestRezSuites(TestBase, TempdirMixin):
         suite.save(path)
         suite2 = Suite.load(path)
         self.assertEqual(suite.get_tools(), suite2.get_tools())
+        self.assertEqual(suite.get_hidden_tools(), suite2.get_hidden_tools())
+        for alias in suite.get_conflicting_aliases():
+            self.assertEqual(suite.get_alias_conflicts(alias),
+                             suite2.get_alias_conflicts(alias))
+        self.assertEqual(set(suite.get_conflicting_aliases()),
+                         set(suite2.get_conflicting_aliases()))
         self.assertEqual(set(suite.context_names), set(suite2.context_names))
 
     def test_1(self):
@@ -99,6 +106,23 @@ class TestRezSuites(TestBase, TempdirMixin):
         expected_tools = set(["fx_fooer_fun", "bahbah", "blacksheep"])
         self.assertEqual(set(s.get_tools().keys()), expected_tools)
 
+        # entries support both attribute and item access
+        entry = s.get_tools()["fx_fooer_fun"]
+        self.assertEqual(entry.tool_name, "fooer")
+        self.assertEqual(entry["tool_name"], "fooer")
+        self.assertEqual(entry["context_name"], "foo")
+        self.assertTrue("tool_name" in entry)
+        self.assertFalse("hidden" in entry)
+        self.assertEqual(set(entry.keys()),
+                         set(["tool_name", "tool_alias", "context_name",
+                              "variant"]))
+
+        d = entry.copy()
+        d["hidden"] = True
+        self.assertFalse("hidden" in entry)
+        del d["hidden"]
+        self.assertEqual(entry, d)
+
         self._test_serialization(s)
 
     def test_3(self):
@@ -141,6 +165,104 @@ class TestRezSuites(TestBase, TempdirMixin):
 
         self._test_serialization(s)
 
+    def test_4(self):
+        """Test that loading a suite twice gives independent suites."""
+        c_bah = ResolvedContext(["bah"])
+        s = Suite()
+        s.add_context("bah", c_bah)
+
+        path = os.path.join(self.root, uuid.uuid4().hex)
+        s.save(path)
+
+        s2 = Suite.load(path)
+        s2.alias_tool("bah", "blacksheep", "whitesheep")
+        s2.hide_tool("bah", "bahbah")
+        expected_tools = set(["whitesheep"])
+        self.assertEqual(set(s2.get_tools().keys()), expected_tools)
+
+        s3 = Suite.load(path)
+        expected_tools = set(["bahbah", "blacksheep"])
+        self.assertEqual(set(s3.get_tools().keys()), expected_tools)
+
+    def test_5(self):
+        """Test saving a loaded suite back over itself."""
+        c_foo = ResolvedContext(["foo"])
+        c_bah = ResolvedContext(["bah"])
+        s = Suite()
+        s.add_context("foo", c_foo)
+        s.add_context("bah", c_bah)
+
+        path = os.path.join(self.root, uuid.uuid4().hex)
+        s.save(path)
+
+        s2 = Suite.load(path)
+        s2.remove_context("bah")
+        s2.add_context("bah2", c_bah)
+        s2.set_context_prefix("bah2", "b_")
+        s2.save(path)
+
+        contexts_path = os.path.join(path, "contexts")
+        self.assertEqual(set(os.listdir(contexts_path)),
+                         set(["foo.rxt", "bah2.rxt"]))
+
+        expected_tools = set(["fooer", "b_bahbah", "b_blacksheep"])
+        self.assertEqual(set(os.listdir(os.path.join(path, "bin"))),
+                         expected_tools)
+
+        s3 = Suite.load(path)
+        self.assertEqual(set(s3.get_tools().keys()), expected_tools)
+        self.assertEqual(s3.context("foo").parent_suite_path, path)
+        self.assertEqual(s3.context("bah2").parent_suite_path, path)
+
+        # saving over a suite that's missing its contexts dir
+        s4 = Suite.load(path)
+        s4.remove_context("foo")
+        s4.context("bah2")  # load before its file is deleted
+        shutil.rmtree(contexts_path)
+        s4.save(path)
+        self.assertEqual(os.listdir(contexts_path), ["bah2.rxt"])
+
+    def test_6(self):
+        """Test loading a suite saved over itself with an unchanged stat."""
+        c_bah = ResolvedContext(["bah"])
+        s = Suite()
+        s.add_context("bah", c_bah)
+        s.set_context_prefix("bah", "a_")
+
+        path = os.path.join(self.root, uuid.uuid4().hex)
+        s.save(path)
+        filepath = os.path.join(path, "suite.yaml")
+
+        s2 = Suite.load(path)  # caches the parsed suite.yaml
+        st = os.stat(filepath)
+
+        # same file size, and mtime unchanged as on a coarse-mtime filesystem
+        s2.set_context_prefix("bah", "b_")
+        s2.save(path)
+        os.utime(filepath, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(os.stat(filepath).st_size, st.st_size)
+
+        s3 = Suite.load(path)
+        expected_tools = set(["b_bahbah", "b_blacksheep"])
+        self.assertEqual(set(s3.get_tools().keys()), expected_tools)
+
+    def test_7(self):
+        """Test that tools returned by a suite aren't changed by mutations."""
+        c_foo = ResolvedContext(["foo"])
+        c_bah = ResolvedContext(["bah"])
+        s = Suite()
+        s.add_context("foo", c_foo)
+        s.add_context("bah", c_bah)
+
+        tools = s.get_tools()
+        for entry in tools.values():
+            s.hide_tool(entry["context_name"], entry["tool_name"])
+
+        expected_tools = set(["fooer", "bahbah", "blacksheep"])
+        self.assertEqual(set(tools.keys()), expected_tools)
+        self.assertEqual(s.get_tools(), {})
+        self.assertEqual(len(s.get_hidden_tools()), 3)
+
     @per_available_shell()
     @install_dependent()
     def test_executable(self, shell):